@@ -5,6 +5,7 @@ Copyright © 2024 - Elliot Simpson
 
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -83,13 +84,13 @@ class Display:
 
         if top_left_x < 0:
             top_left_x = 0
-        elif top_left_x + settings.SCREEN_WIDTH > pf.mask.shape[0]:
-            top_left_x = pf.mask.shape[0] - settings.SCREEN_WIDTH
+        elif top_left_x + settings.SCREEN_WIDTH > pf.width:
+            top_left_x = pf.width - settings.SCREEN_WIDTH
 
         if top_left_y < 0:
             top_left_y = 0
-        elif top_left_y + settings.SCREEN_HEIGHT > pf.mask.shape[1]:
-            top_left_y = pf.mask.shape[1] - settings.SCREEN_HEIGHT
+        elif top_left_y + settings.SCREEN_HEIGHT > pf.height:
+            top_left_y = pf.height - settings.SCREEN_HEIGHT
 
         return int(top_left_x), int(top_left_y)
 
@@ -149,7 +150,8 @@ class Display:
             )
 
         else:
-            self.vx -= np.sign(self.vx) * settings.MOUSE_CAMERA_ACCELERATION
+            if self.vx:
+                self.vx -= math.copysign(settings.MOUSE_CAMERA_ACCELERATION, self.vx)
             if abs(self.vx) < settings.MOUSE_CAMERA_ACCELERATION:
                 self.vx = 0.0
 
@@ -170,7 +172,8 @@ class Display:
             )
 
         else:
-            self.vy -= np.sign(self.vy) * settings.MOUSE_CAMERA_ACCELERATION
+            if self.vy:
+                self.vy -= math.copysign(settings.MOUSE_CAMERA_ACCELERATION, self.vy)
             if abs(self.vy) < settings.MOUSE_CAMERA_ACCELERATION:
                 self.vy = 0.0
 
@@ -180,7 +183,7 @@ class Display:
         Args:
             pf: The playing field over which the camera moves.
         """
-        pf_width, pf_height = pf.mask.shape
+        pf_width, pf_height = pf.width, pf.height
         self.x += self.vx
         self.y += self.vy
 
@@ -44,7 +44,7 @@ class GamePlay(Module):
         self.focus: tuple[int, int] | None = None
         self.attack_selector: AttackSelector | None = None
         self.test_bombsite()
-        self.display.set_focus(*self.playing_field.controlled_character.kinematics.pos.astype(int))
+        self.display.set_focus(*self.playing_field.controlled_character.kinematics.intpos)
 
     def test_bombsite(self) -> None:
         """Ensures that the playing field has teams/characters."""
@@ -69,8 +69,11 @@ class GamePlay(Module):
             team_3.add_character(900, 500, "Alex"),
         ]
 
-        self.playing_field.world_objects = characters
-        next(self.playing_field.next_team().character_queue).take_control()
+        # Places the characters onto the playing field.
+        for character in characters:
+            self.playing_field.add_world_object(character)
+
+        self.playing_field.next_team().next_character().take_control()
 
     def process_event(self, event: pygame.event.Event) -> ModuleComponent | None | SystemExit:
         """Handles an incoming gameplay event.
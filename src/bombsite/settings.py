@@ -13,6 +13,7 @@ TIME_TO_RETREAT: int = 3
 TIME_TO_WAIT_FOR_TURN: int = 1
 LOG_LENGTH: int = 3
 MAX_HEALTH: int = 100
+GRAVITY: float = 0.05
 ROCKET_BLAST_RADIUS: int = 60
 GRENADE_BLAST_RADIUS: int = 60
 MAXIMUM_FIRING_ANGLE: int = 88
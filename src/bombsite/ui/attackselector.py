@@ -20,6 +20,9 @@ if TYPE_CHECKING:
     from bombsite.world.attacks.attack import Attack
     from bombsite.world.teams.teams import Team
 
+# Every attack that can be used, in the order in which they are shown and considered.
+_ALL_ATTACKS: tuple[type[Attack], ...] = (RocketLauncher, ThrowGrenade)
+
 
 class AttackSelector:
     """The collection of attacks, where users can decide what to do.
@@ -48,13 +51,13 @@ class AttackSelector:
         self.load_buttons()
 
     @staticmethod
-    def all_attacks() -> list[type[Attack]]:
-        """Returns a list of all the attacks that can be used.
+    def all_attacks() -> tuple[type[Attack], ...]:
+        """Returns all the attacks that can be used.
 
         Returns:
-            A list of every attack available.
+            A tuple of every attack available, which is built only once.
         """
-        return [RocketLauncher, ThrowGrenade]
+        return _ALL_ATTACKS
 
     def load_buttons(self) -> None:
         """Generates each of the buttons in the attack selection."""
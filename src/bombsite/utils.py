@@ -5,6 +5,8 @@ Copyright © 2024 - Elliot Simpson
 
 from pathlib import Path
 
+import pygame
+
 __all__: list[str] = ["package_path"]
 
 package_path: Path = Path(__file__).parent
@@ -19,3 +21,18 @@ def return_system_exit() -> SystemExit:
         A SystemExit with a return code of zero.
     """
     return SystemExit(0)
+
+
+def convert_alpha_if_possible(surface: pygame.Surface) -> pygame.Surface:
+    """Converts a surface to the display's pixel format so that it is fast to blit.
+
+    Args:
+        surface: The surface to be converted.
+
+    Returns:
+        The converted surface, or the original surface if no display mode has been set yet.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+
+    return surface.convert_alpha()
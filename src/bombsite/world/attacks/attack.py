@@ -9,13 +9,15 @@ import abc
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
+import numpy.typing as npt
 import pygame
 
 if TYPE_CHECKING:
     from bombsite.world.characters.characters import Character
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackOverride:
     """The description of the attack the character must launch."""
 
@@ -28,6 +30,24 @@ class AttackOverride:
     power: float = 0
     """The power with which a projectile should be launched/fired."""
 
+    direction: npt.NDArray[np.double] | None = None
+    """The unit vector for the angle and direction of the attack, if already calculated."""
+
+    def velocity(self, launcher: Character) -> npt.NDArray[np.double]:
+        """Determines the velocity with which the attack's projectile is launched.
+
+        Args:
+            launcher: The character launching the attack.
+
+        Returns:
+            The x and y components of the projectile's velocity at launch.
+        """
+        direction = self.direction
+        if direction is None:
+            direction = launcher.angle_array(self.angle, self.leftwards)
+
+        return direction * self.power
+
 
 class Attack(metaclass=abc.ABCMeta):
     """An attack with interfaces for what projectiles, etc. it releases."""
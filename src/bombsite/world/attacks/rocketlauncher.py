@@ -74,7 +74,7 @@ class RocketLauncher(Attack):
         rocket = self._create_rocket(launcher, projectile_vel)
 
         # Adds the rocket to the world.
-        launcher.pf.world_objects.append(rocket)
+        launcher.pf.add_world_object(rocket)
 
     def release_phantom(
         self, launcher: Character, attack_override: AttackOverride
@@ -91,10 +91,7 @@ class RocketLauncher(Attack):
             targeted character.
         """
         # Determines the velocity of the rocket at launch.
-        projectile_vel = (
-            launcher.angle_array(attack_override.angle, attack_override.leftwards)
-            * attack_override.power
-        )
+        projectile_vel = attack_override.velocity(launcher)
 
         # Creates a rocket instance.
         return self._create_rocket(launcher, projectile_vel).phantom(launcher)
@@ -60,7 +60,7 @@ class ThrowGrenade(Attack):
         )
 
         # Adds the grenade to the world.
-        launcher.pf.world_objects.append(grenade)
+        launcher.pf.add_world_object(grenade)
 
     def release_phantom(
         self, launcher: Character, attack_override: AttackOverride
@@ -77,10 +77,7 @@ class ThrowGrenade(Attack):
             targeted character.
         """
         # Determines the velocity of the grenade at launch.
-        grenade_vel = (
-            launcher.angle_array(attack_override.angle, attack_override.leftwards)
-            * attack_override.power
-        )
+        grenade_vel = attack_override.velocity(launcher)
 
         # Creates a grenade instance.
         return Grenade(
@@ -0,0 +1,56 @@
+"""characterarrays.py provides the living characters' attributes laid out for vectorized queries.
+
+Copyright © 2024 - Elliot Simpson
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:
+    from bombsite.world.characters.characters import Character
+
+
+@dataclass(slots=True)
+class CharacterArrays:
+    """A structure of arrays for a collection of characters, aligned by index."""
+
+    characters: list[Character]
+    """The characters described by each row of the arrays."""
+
+    positions: npt.NDArray[np.double]
+    """The x and y coordinates of each character, as an array of shape (N, 2)."""
+
+    team_numbers: npt.NDArray[np.int_]
+    """The number of the team to which each character belongs."""
+
+    hp: npt.NDArray[np.int_]
+    """The hit points of each character."""
+
+    @classmethod
+    def from_characters(cls, characters: Iterable[Character]) -> CharacterArrays:
+        """Gathers the attributes of the characters into arrays.
+
+        Args:
+            characters: The characters to be described.
+
+        Returns:
+            The arrays describing the characters.
+        """
+        character_list = list(characters)
+
+        return cls(
+            characters=character_list,
+            positions=np.array(
+                [character.kinematics.pos for character in character_list], dtype=np.double
+            ).reshape(-1, 2),
+            team_numbers=np.array(
+                [character.details.team.team_number for character in character_list], dtype=np.int_
+            ),
+            hp=np.array([character.health.hp for character in character_list], dtype=np.int_),
+        )
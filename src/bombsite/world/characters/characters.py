@@ -14,7 +14,7 @@ import pygame.key
 
 import bombsite.display
 from bombsite import settings
-from bombsite.utils import fonts_path
+from bombsite.utils import convert_alpha_if_possible, fonts_path
 from bombsite.world import logger
 from bombsite.world.characters.control import Control
 from bombsite.world.characters.details import Details
@@ -27,6 +27,17 @@ if TYPE_CHECKING:
     from bombsite.world.teams.teams import Team
 
 
+def _create_health_bar_outline() -> pygame.Surface:
+    """Draws the black outline of a health bar onto an otherwise transparent surface.
+
+    Returns:
+        The surface containing the outline.
+    """
+    outline = pygame.Surface((40, 10), pygame.SRCALPHA)
+    pygame.draw.rect(outline, pygame.Color("black"), ((0, 0), (40, 10)), 1)
+    return outline
+
+
 class Character(WorldObject):
     """A character that can move and attack.
 
@@ -35,13 +46,19 @@ class Character(WorldObject):
         control: The attributes of the character relating to control by a team.
         _facing_l: Whether or not the character is facing to the left.
         health: The health the character.
+        _name_surface: The rendering of the character's name.
     """
 
+    __slots__ = ("details", "control", "_facing_l", "health", "_name_surface")
+
     font: pygame.font.Font = pygame.font.Font(
         fonts_path / "playpen_sans" / "PlaypenSans-Regular.ttf", 10
     )
     """The font used to render the names of the characters."""
 
+    health_bar_outline: pygame.Surface = _create_health_bar_outline()
+    """The outline of the health bar, which is identical for every character."""
+
     def __init__(
         self,
         pf: playing_field.PlayingField,
@@ -63,6 +80,11 @@ class Character(WorldObject):
         self._facing_l: bool = random.choice((True, False))
         self.health: Health = Health()
 
+        # Renders the name while the match is loading, rather than on the first frame it is shown.
+        self._name_surface: pygame.Surface = convert_alpha_if_possible(
+            self.font.render(self.details.name, True, self.details.team.colour)
+        )
+
     def __str__(self) -> str:
         return self.details.name
 
@@ -205,34 +227,42 @@ class Character(WorldObject):
         Args:
             display: The display onto which the health bar is to be drawn.
         """
+        bar_pos = (self.kinematics.x - 20 - display.x, self.kinematics.y - 20 - display.y)
         pygame.draw.rect(
-            display.screen,
-            self._health_colour,
-            (
-                (self.kinematics.x - 20 - display.x, self.kinematics.y - 20 - display.y),
-                (int(40 * self.health.hp / 100), 10),
-            ),
-        )
-        pygame.draw.rect(
-            display.screen,
-            pygame.Color("black"),
-            ((self.kinematics.x - 20 - display.x, self.kinematics.y - 20 - display.y), (40, 10)),
-            1,
+            display.screen, self._health_colour, (bar_pos, (int(40 * self.health.hp / 100), 10))
         )
+        display.screen.blit(self.health_bar_outline, bar_pos)
 
-    def _display_name(
-        self, display: bombsite.display.Display, draw_pos: npt.NDArray[np.int_]
-    ) -> None:
+    def _display_name(self, display: bombsite.display.Display, draw_pos: tuple[int, int]) -> None:
         """Writes the character's name onto the playing field.
 
         Args:
             display: The display onto which the character's name is to be drawn.
             draw_pos: The position of the character relative to the screen.
         """
-        text_surface = self.font.render(self.details.name, 1, self.details.team.colour)
+        text_surface = self._name_surface
         draw_x, draw_y = draw_pos
         display.screen.blit(text_surface, (draw_x - text_surface.get_width() // 2, draw_y - 50))
 
+    def _is_off_screen(self, display: bombsite.display.Display) -> bool:
+        """Determines whether or not anything drawn for the character would be outside the screen.
+
+        Args:
+            display: The display onto which the character is to be drawn.
+
+        Returns:
+            True if the character, its name, and its health bar are all outside the screen,
+            otherwise False.
+        """
+        screen_x = self.kinematics.x - display.x
+        screen_y = self.kinematics.y - display.y
+        return (
+            screen_x < -30
+            or screen_x > settings.SCREEN_WIDTH + 30
+            or screen_y < -30
+            or screen_y > settings.SCREEN_HEIGHT + 60
+        )
+
     def draw(self, display: bombsite.display.Display) -> None:
         """Draws the character onto the playing field.
 
@@ -242,7 +272,15 @@ class Character(WorldObject):
         if not self.health.alive:
             return
 
-        draw_pos = self.kinematics.pos.astype(int) - display.pos
+        # Skips characters outside the screen, allowing for the name and health bar above them. The
+        # controlled character is always drawn, since its aim can stretch back onto the screen.
+        if not self.control.controlled and self._is_off_screen(display):
+            return
+
+        draw_pos = (
+            int(self.kinematics.x) - int(display.x),
+            int(self.kinematics.y) - int(display.y),
+        )
 
         if self.control.controlled:
             # Draws a triangle above the controlled character.
@@ -305,12 +343,7 @@ class Character(WorldObject):
 
     def _collide(self) -> None:
         """Enacts a collision with the playing field."""
-        lower_bound = self.kinematics.pos.astype(int)
-
-        if not self.pf.collision_pixel(*lower_bound):
-            upper_bound = (self.kinematics.pos + self.kinematics.vel).astype(int)
-            self.set_pos(self.pf.find_collision_point(lower_bound, upper_bound))
-
+        self._move_to_collision_point()
         self._collision_damage()
         self._bounce()
 
@@ -340,8 +373,7 @@ class Character(WorldObject):
             return
 
         # Makes the character accelerate downwards.
-        self.apply_gravity()
-        self._update_position()
+        self._fall()
 
         self._update_facing_direction()
         self._check_outside_boundaries()
@@ -362,6 +394,7 @@ class Character(WorldObject):
         """
         self.control.controlled = True
         self.pf.last_controlled = self
+        self.pf.set_controlled_character(self)
         return self
 
     def relinquish_control(self) -> None:
@@ -370,6 +403,9 @@ class Character(WorldObject):
         self.control.controlled = False
         self.control.preparing_attack = False
 
+        if self.pf.controlled_character_or_none is self:
+            self.pf.set_controlled_character(None)
+
     def _jump(self) -> None:
         """Causes the character to leap."""
         if self._is_standing:
@@ -379,24 +415,30 @@ class Character(WorldObject):
             elif self.control.walking == Walking.RIGHT:
                 self.set_vx(1.0)
 
+    def _can_walk(self, step: int) -> bool:
+        """Whether or not the character may start walking in a direction.
+
+        Args:
+            step: The horizontal step of the walk, being -1 for the left, or 1 for the right.
+
+        Returns:
+            True if the game state allows the character to walk and nothing blocks its path,
+            otherwise False.
+        """
+        game_state = self.pf.game_state
+        return (
+            (game_state.controlled_can_attack and self._is_standing)
+            or game_state.controlled_can_just_walk
+        ) and not self.pf.collision_pixel(self.kinematics.x + step, self.kinematics.y - 2)
+
     def _walk_left(self) -> None:
         """Makes the character attempt to walk to the left."""
-        if (
-            self._is_standing
-            and self.pf.game_state.controlled_can_attack
-            or self.pf.game_state.controlled_can_just_walk
-            and not self.pf.collision_pixel(self.kinematics.x - 1, self.kinematics.y - 2)
-        ):
+        if self._can_walk(-1):
             self.control.walking = Walking.LEFT
 
     def _walk_right(self) -> None:
         """Makes the character attempt to walk to the right."""
-        if (
-            self._is_standing
-            and self.pf.game_state.controlled_can_attack
-            or self.pf.game_state.controlled_can_just_walk
-            and not self.pf.collision_pixel(self.kinematics.x + 1, self.kinematics.y - 2)
-        ):
+        if self._can_walk(1):
             self.control.walking = Walking.RIGHT
 
     def _stop_walking(self) -> None:
@@ -480,6 +522,23 @@ class Character(WorldObject):
         facing_l = facing_l if facing_l is not None else self.facing_l
         return np.array((np.cos(angle_radians) * (-1) ** facing_l, -np.sin(angle_radians)))
 
+    @staticmethod
+    def angle_array_batch(angles: npt.NDArray[np.double], facing_l: bool) -> npt.NDArray[np.double]:
+        """Converts many firing angles at once into unit vectors in their directions.
+
+        Args:
+            angles: The angles, in degrees, for which the firing directions are being calculated.
+            facing_l: The direction the character is facing. True if the character is facing left,
+                otherwise False.
+
+        Returns:
+            An array with a row for each angle, holding the horizontal and vertical components of
+            the firing direction.
+        """
+        angles_radians = np.radians(angles)
+        sign = -1.0 if facing_l else 1.0
+        return np.stack((np.cos(angles_radians) * sign, -np.sin(angles_radians)), axis=-1)
+
     def process_key_presses(self, pressed_keys: pygame.key.ScancodeWrapper) -> None:
         """Reacts to the users commands from held keys.
 
@@ -510,6 +569,17 @@ class Character(WorldObject):
         elif pressed_keys[pygame.K_DOWN]:
             self.aim_downwards()
 
+    def die(self) -> None:
+        """Kills the character, bringing it to a halt."""
+        if self.health.alive:
+            self.details.team.alive_count -= 1
+
+        self.health.alive = False
+        self.kinematics.null_velocity()
+
+        # The character must no longer be counted amongst the living.
+        self.pf.invalidate_alive_characters()
+
     def _check_outside_boundaries(self) -> None:
         """Checks if the character has fallen outside the map boundaries."""
         if not self.health.alive:
@@ -517,13 +587,12 @@ class Character(WorldObject):
 
         if self._exited_playing_field():
             logger.logger.log(f"{self} has fallen off the face of the earth!")
-            self.health.alive = False
-            self.kinematics.null_velocity()
+            self.die()
 
     def _collision_damage(self) -> None:
         """Causes damage to the character from hitting a surface."""
         # Calculates the speed at which the character hits the ground.
-        entry_speed = np.linalg.norm(self.kinematics.vel)
+        entry_speed = self.kinematics.speed
 
         # If the collision is a small one, the character stops and does
         # not bounce.
@@ -537,8 +606,7 @@ class Character(WorldObject):
         # Checks if the collision of the character was fatal.
         if self.health.hp <= 0:
             # Destroys the character.
-            self.health.alive = False
-            self.kinematics.null_velocity()
+            self.die()
 
             # Sends a message depending on who killed the
             # character.
@@ -569,4 +637,4 @@ class Character(WorldObject):
             True if the world object will remain still without provocation, False if it is moving
             or could cause motion later.
         """
-        return not np.any(self.kinematics.vel)
+        return not self.kinematics.is_moving
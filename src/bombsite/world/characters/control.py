@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from bombsite.world.characters.walking import Walking
 
 
-@dataclass
+@dataclass(slots=True)
 class Control:
     """A collection of attributes specific to a character's control."""
 
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from bombsite.world.teams.teams import Team
 
 
-@dataclass
+@dataclass(slots=True)
 class Details:
     """A collection of attributes specific to who a character is."""
 
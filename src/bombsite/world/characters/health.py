@@ -6,7 +6,7 @@ Copyright © 2024 - Elliot Simpson
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Health:
     """Contains the individual attributes relating to the healthiness of a character."""
 
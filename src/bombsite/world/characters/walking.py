@@ -3,10 +3,10 @@
 Copyright © 2024 - Elliot Simpson
 """
 
-from enum import Enum
+from enum import IntEnum
 
 
-class Walking(Enum):
+class Walking(IntEnum):
     """An enum for the direction in which the character is walking."""
 
     NA = 1
@@ -8,12 +8,12 @@ from dataclasses import dataclass
 import pygame
 
 from bombsite import settings
-from bombsite.utils import fonts_path
+from bombsite.utils import convert_alpha_if_possible, fonts_path
 
 pygame.font.init()
 
 
-@dataclass
+@dataclass(slots=True)
 class LogMessage:
     """A single log message and the corresponding drawn text."""
 
@@ -23,6 +23,9 @@ class LogMessage:
     _image: pygame.Surface | None
     """The rendering of the log message. If the message has expired, the image is discarded."""
 
+    height: int
+    """The height of the rendering of the log message."""
+
     @property
     def image(self) -> pygame.Surface:
         """Obtains the image of the log message.
@@ -50,6 +53,8 @@ class Logger:
     Attributes:
         messages: A list of all messages that have entered the log.
         font: The font used for rendering the log messages.
+        _render_cache: The renderings of the messages still on display, keyed by their text, so that
+            repeated messages are not rendered again.
     """
 
     def __init__(self) -> None:
@@ -58,6 +63,24 @@ class Logger:
         self.font: pygame.font.Font = pygame.font.Font(
             fonts_path / "playpen_sans" / "PlaypenSans-Regular.ttf", 30
         )
+        self._render_cache: dict[str, pygame.Surface] = {}
+
+    def _render(self, text: str) -> pygame.Surface:
+        """Renders the text of a log message, reusing any rendering of identical text.
+
+        Args:
+            text: The message to be rendered.
+
+        Returns:
+            The image of the rendered message.
+        """
+        image = self._render_cache.get(text)
+
+        if image is None:
+            image = convert_alpha_if_possible(self.font.render(text, True, (0, 0, 0)))
+            self._render_cache[text] = image
+
+        return image
 
     def log(self, text: str) -> None:
         """Adds a new message to the log.
@@ -66,11 +89,20 @@ class Logger:
             text: The message to be added.
         """
         # Creates a new Log message instance.
-        new_message = LogMessage(text, self.font.render(text, False, (0, 0, 0)))
+        image = self._render(text)
+        new_message = LogMessage(text, image, image.get_height())
 
         # Only stores three text images at a time to save memory.
         if len(self.messages) >= settings.LOG_LENGTH:
-            del self.messages[-settings.LOG_LENGTH].image
+            expired_message = self.messages[-settings.LOG_LENGTH]
+            del expired_message.image
+
+            # Forgets the rendering once no message on display still uses it.
+            displayed_messages = self.messages[len(self.messages) - settings.LOG_LENGTH + 1 :]
+            if text != expired_message.text and all(
+                message.text != expired_message.text for message in displayed_messages
+            ):
+                del self._render_cache[expired_message.text]
 
         print(text)
 
@@ -87,10 +119,18 @@ class Logger:
         x = 5
         y = settings.SCREEN_HEIGHT - 5
 
-        # Iterates over each message and draws it.
-        for log in self.messages[: -settings.LOG_LENGTH - 1 : -1]:
-            y -= log.image.get_height()
-            screen.blit(log.image, (x, y))
+        # Iterates over each displayed message, from the newest to the oldest, and positions it.
+        blit_sequence: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        number_of_messages = len(self.messages)
+        for index in range(
+            number_of_messages - 1, max(-1, number_of_messages - settings.LOG_LENGTH - 1), -1
+        ):
+            log = self.messages[index]
+            y -= log.height
+            blit_sequence.append((log.image, (x, y)))
+
+        # Draws all the messages at once.
+        screen.blits(blit_sequence, doreturn=False)
 
 
 logger: Logger = Logger()
@@ -17,33 +17,62 @@ if TYPE_CHECKING:
     from bombsite.world.projectiles.projectiles import Projectile
 
 
-def check_character_caught_by_explosion(
-    pos: npt.NDArray[np.double],
-    character: characters.Character,
-    caused_by: characters.Character,
-    radius: int = 40,
-) -> None:
-    """Checks if an explosion to damage the nearby terrain and characters.
+def _find_characters_within_radius(
+    pos: npt.NDArray[np.double], positions: npt.NDArray[np.double], radius: float
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.double], npt.NDArray[np.double]]:
+    """Finds which of many characters lie within a given radius of a point.
+
+    Args:
+        pos: The point at the centre of the radius.
+        positions: The positions of the characters, as an array of shape (N, 2).
+        radius: The radius within which to find characters.
+
+    Returns:
+        A tuple containing the indices of the characters within the radius, their displacements
+        from the point, and their distances from the point.
+    """
+    # Discards the characters outside the bounding square of the radius, so that the distance is
+    # only computed for the few that remain.
+    vectors = positions - pos
+    in_box = np.flatnonzero(np.all(np.abs(vectors) < radius, axis=1))
+    vectors = vectors[in_box]
+
+    # Compares the squared distances first, so that square roots are only taken for the
+    # characters within the radius.
+    squared_distances = np.einsum("ij,ij->i", vectors, vectors)
+    within = np.flatnonzero(squared_distances < radius * radius)
+    distances = np.sqrt(squared_distances[within])
+
+    # Keeps the exact comparison with the radius, in case a square root rounds up to it.
+    exact = distances < radius
+    within = within[exact]
+
+    return in_box[within], vectors[within], distances[exact]
+
+
+def find_characters_caught_by_explosion(
+    pos: npt.NDArray[np.double], positions: npt.NDArray[np.double], radius: int = 40
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.double], npt.NDArray[np.double]]:
+    """Finds which of many characters an explosion catches, and how it affects each of them.
 
     Args:
         pos: The source location of the explosion.
-        character: The character being affected by the explosion.
-        caused_by: The character who initiated the explosion.
+        positions: The positions of the characters, as an array of shape (N, 2).
         radius: The radius of the blast.
+
+    Returns:
+        A tuple containing the indices of the characters caught by the explosion, their distances
+        from the blast, and the directions in which they are flung.
     """
-    # Finds the distance from the blast of the character.
-    vector = character.kinematics.pos - pos
-    distance = float(np.linalg.norm(vector))
+    # Only affects the characters that are sufficiently close.
+    caught, blast_vectors, distances = _find_characters_within_radius(pos, positions, radius)
 
-    # Only affects the character if sufficiently close.
-    if distance < radius:
-        # Creates a direction in which the character is flung,
-        # complete with upwards momentum.
-        blast_vector = vector + np.array((0, -25))
-        blast_direction = blast_vector / np.linalg.norm(blast_vector)
+    # Creates the directions in which the characters are flung, complete with upwards momentum.
+    blast_vectors[:, 1] -= 25
+    blast_norms = np.sqrt(np.einsum("ij,ij->i", blast_vectors, blast_vectors))
+    blast_directions = blast_vectors / blast_norms[:, np.newaxis]
 
-        # Flings the character and causes them damage.
-        character_caught_by_explosion(character, caused_by, blast_direction, distance, radius)
+    return caught, distances, blast_directions
 
 
 def character_caught_by_explosion(
@@ -68,8 +97,7 @@ def character_caught_by_explosion(
 
     # Kills the character if it runs out of health.
     if character.health.hp <= 0:
-        character.health.alive = False
-        character.kinematics.null_velocity()
+        character.die()
 
         # Sends a message depending on who killed the
         # character.
@@ -82,7 +110,8 @@ def character_caught_by_explosion(
 
     # Flings the character in the appropriate direction.
     else:
-        character.kinematics.vel += (blast_direction * (radius - distance)) * 0.1
+        character.kinematics.vx += blast_direction[0] * (radius - distance) * 0.1
+        character.kinematics.vy += blast_direction[1] * (radius - distance) * 0.1
 
 
 def estimate_explosion_damage(projectile: Projectile) -> int:
@@ -98,21 +127,16 @@ def estimate_explosion_damage(projectile: Projectile) -> int:
         The net damage calculated by adding all damage to enemies and subtracting all damage to
         allies.
     """
-    # Assumes no damage is caused initially.
-    net_damage = 0
-
-    # Iterates over each living character.
-    for character in projectile.pf.alive_characters():
-        # Finds the distance from the blast of the character.
-        vector = character.kinematics.pos - projectile.kinematics.pos
-        distance = np.linalg.norm(vector)
-
-        # Only affects the character if sufficiently close.
-        if distance < projectile.explosion_radius():
-            damage = int(projectile.explosion_radius() - distance)
-            if character.details.team is projectile.sent_by.details.team:
-                net_damage -= min((damage, character.health.hp))
-            else:
-                net_damage += min((damage, character.health.hp))
-
-    return net_damage
+    characters = projectile.pf.alive_character_arrays
+    radius = projectile.explosion_radius()
+
+    # Only affects the characters that are sufficiently close, damaging each no more than their
+    # remaining health.
+    caught, _, distances = _find_characters_within_radius(
+        projectile.kinematics.pos, characters.positions, radius
+    )
+    damage = np.minimum((radius - distances).astype(np.int_), characters.hp[caught])
+
+    # Counts damage to the sender's own team against them.
+    allied = characters.team_numbers[caught] == projectile.sent_by.details.team.team_number
+    return int((np.where(allied, -1, 1) * damage).sum())
@@ -5,8 +5,10 @@ Copyright © 2024 - Elliot Simpson
 
 from __future__ import annotations
 
-from collections.abc import Callable, Generator
-from typing import TYPE_CHECKING, TypeVar
+import functools
+import math
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
 
 import numpy as np
 import numpy.typing as npt
@@ -15,6 +17,7 @@ import pygame
 from bombsite import settings, ticks
 from bombsite.utils import package_path
 from bombsite.world import gamestate, logger, world_objects
+from bombsite.world.characterarrays import CharacterArrays
 from bombsite.world.characters import characters
 from bombsite.world.misc import explosion
 
@@ -23,7 +26,23 @@ if TYPE_CHECKING:
     from bombsite.world.teams import teams
 
 
-WO = TypeVar("WO", bound=world_objects.WorldObject)
+@functools.lru_cache(maxsize=16)
+def _crater_stamp(radius: int) -> npt.NDArray[np.bool_]:
+    """Creates the template of the ground kept around a crater of a given radius.
+
+    Args:
+        radius: The radius of the crater.
+
+    Returns:
+        An array of shape (2 * radius + 1, 2 * radius + 1) which is True wherever the ground outside
+        the crater remains.
+    """
+    x, y = np.ogrid[-radius : radius + 1, -radius : radius + 1]
+    stamp = x**2 + y**2 > radius**2
+
+    # Prevents the cached template from being altered by whoever uses it.
+    stamp.flags.writeable = False
+    return stamp
 
 
 class UndefinedPropertyError(AttributeError):
@@ -36,14 +55,33 @@ class PlayingField:
     Attributes:
         image: The base image of the solid ground for the playing field.
         mask: An array the size of the playing field which indicates whether or not there is solid
-            ground at a corresponding coordinate.
+            ground at a corresponding coordinate. It is indexed by row and then column, so by y and
+            then x, to match the layout of the image in memory.
+        width: The width of the playing field in pixels.
+        height: The height of the playing field in pixels.
+        terrain_version: A number which increases whenever the solid ground of the playing field
+            changes.
         teams: A list of teams that are fighting one another on the playing field.
         _last_controlled: Whichever character is either being controlled presently or was most
             recently controlled on the playing field.
+        _controlled: The character being controlled by the user, if there is one.
         world_objects: A list of all physical world objects on the playing field, such as characters
             and projectiles.
+        _characters: The world objects which are characters, kept in the order they were added.
         game_state: A data structure from which the present game state can be inferred, such as
             whether or not a character may or may not move.
+        _alive_characters: The characters which are alive, if they have been gathered since a
+            character was last added, removed, or killed, otherwise None.
+        _alive_team_count: The number of teams with a living character, if it has been counted since
+            a character was last added, removed, or killed, otherwise None.
+        _alive_character_arrays: The arrays describing the living characters, if they have been
+            gathered since the world objects last changed, otherwise None.
+        _dirty_regions: The bounding boxes of the craters carved into the mask which have yet to be
+            shown on the image.
+        _next_state_check_tick: The first tick on which the game state could change, found
+            whenever the game state last changed.
+        _unsettled_objects: The world objects which were not in a steady state when the playing
+            field last updated.
     """
 
     def __init__(self, name: str) -> None:
@@ -57,7 +95,12 @@ class PlayingField:
         self.image: pygame.Surface = pygame.image.load(path_to_image).convert_alpha()
 
         # Finds the playing field's image's alpha array.
-        self.mask: npt.NDArray[np.uint8] = pygame.surfarray.array_alpha(self.image)
+        self.mask: npt.NDArray[np.uint8] = np.ascontiguousarray(
+            pygame.surfarray.array_alpha(self.image).T
+        )
+        self.height: int = self.mask.shape[0]
+        self.width: int = self.mask.shape[1]
+        self.terrain_version: int = 0
 
         # Applies an initial mask on the image to remove
         # semi-transparent pixels.
@@ -68,13 +111,29 @@ class PlayingField:
 
         # Gives control of the first-created character to the user.
         self._last_controlled: characters.Character | None = None
+        self._controlled: characters.Character | None = None
 
         # Creates the world objects.
         self.world_objects: list[world_objects.WorldObject] = []
+        self._characters: list[characters.Character] = []
 
         # Sets variables that determine the state of the game.
         self.game_state: gamestate.GameState = gamestate.GameState()
 
+        # The living characters, and their attributes as arrays, are only gathered when needed.
+        self._alive_characters: list[characters.Character] | None = None
+        self._alive_team_count: int | None = None
+        self._alive_character_arrays: CharacterArrays | None = None
+
+        # The regions of the mask that have changed since the image was last brought up to date.
+        self._dirty_regions: list[tuple[int, int, int, int]] = []
+
+        # Checks the game state on every tick until the first change in state.
+        self._next_state_check_tick: int = 0
+
+        # Keeps track of the world objects that are moving or could still cause motion.
+        self._unsettled_objects: list[world_objects.WorldObject] = []
+
     @property
     def last_controlled(self) -> characters.Character:
         """Returns the last controlled character.
@@ -122,15 +181,43 @@ class PlayingField:
 
         raise ValueError(f"Scanned teams {list(live_teams)} and didn't find {last_team}")
 
-    def alive_characters(self) -> Generator[characters.Character, None, None]:
-        """Iterates over all characters on the playing field that are alive.
+    def alive_characters(self) -> list[characters.Character]:
+        """Lists all characters on the playing field that are alive.
 
-        Yields:
+        The list is gathered on first use and reused until a character is added, removed, or killed.
+
+        Returns:
             Each character on the playing field that have a positive quantity of health.
         """
-        for character in self.characters:
-            if character.health.alive:
-                yield character
+        if self._alive_characters is None:
+            self._alive_characters = [
+                character for character in self.characters if character.health.alive
+            ]
+
+        return self._alive_characters
+
+    def invalidate_alive_characters(self) -> None:
+        """Discards what is known about the living characters and teams, as it may have changed."""
+        self._alive_characters = None
+        self._alive_team_count = None
+
+    @property
+    def alive_character_arrays(self) -> CharacterArrays:
+        """Returns the attributes of the living characters as arrays.
+
+        The arrays are gathered on first use and reused until the world objects next update.
+
+        Returns:
+            The arrays describing every character on the playing field that is alive.
+        """
+        if self._alive_character_arrays is None:
+            self._alive_character_arrays = CharacterArrays.from_characters(self.alive_characters())
+
+        return self._alive_character_arrays
+
+    def invalidate_character_arrays(self) -> None:
+        """Discards the arrays describing the living characters, as they may have changed."""
+        self._alive_character_arrays = None
 
     def get_centre(self) -> npt.NDArray[np.int_] | None:
         """Finds the centre point of all moving objects on screen.
@@ -138,16 +225,19 @@ class PlayingField:
         Returns:
             The new position for the focus if there are moving objects.
         """
-        xs = []
-        ys = []
+        total_x = 0.0
+        total_y = 0.0
+        number_moving = 0
 
-        for wo in self.world_objects:
-            if np.any(wo.kinematics.vel):
-                xs.append(wo.kinematics.x)
-                ys.append(wo.kinematics.y)
+        # Only world objects that are not in a steady state can be moving.
+        for wo in self._unsettled_objects:
+            if wo.kinematics.is_moving:
+                total_x += wo.kinematics.x
+                total_y += wo.kinematics.y
+                number_moving += 1
 
-        if xs:
-            return np.array((np.average(xs), np.average(ys)))
+        if number_moving:
+            return np.array((total_x / number_moving, total_y / number_moving))
 
         return None
 
@@ -159,9 +249,18 @@ class PlayingField:
         """
         focus = self._process_tick()
 
+        self.invalidate_character_arrays()
         for wo in self.world_objects:
             wo.update()
 
+            # Any world object's update may move, damage, or kill characters.
+            self.invalidate_character_arrays()
+
+        # Records which world objects have yet to settle, once all have updated.
+        self._unsettled_objects = [wo for wo in self.world_objects if not wo.is_in_steady_state()]
+
+        self._flush_craters()
+
         return focus
 
     def _process_tick(self) -> tuple[int, int] | None:
@@ -170,47 +269,50 @@ class PlayingField:
         Returns:
             Where the camera should be focused if there is a new focus, otherwise None.
         """
-        # Calculates the time in seconds since the game state changed.
-        no_ticks = ticks.total_ticks - self.game_state.last_general_tick
-        time = no_ticks / settings.TICKS_PER_SECOND
+        # Nothing can change until the time limit of the present game state has run out.
+        if ticks.total_ticks < self._next_state_check_tick:
+            return None
+
+        game_state = self.game_state
+        time = self.time_since_state_change
 
         # Ends the time to attack if the user was too slow.
-        if self.game_state.controlled_can_attack:
+        if game_state.controlled_can_attack:
             if time > settings.TIME_TO_ACT:
                 self.controlled_character.relinquish_control()
+                game_state.controlled_can_attack = False
+                game_state.between_turns = True
                 self.refresh_tick()
-                self.game_state.controlled_can_attack = False
-                self.game_state.between_turns = True
 
         # Ends the time to walk after their attack if enough time has
         # passed.
-        elif self.game_state.controlled_can_just_walk:
+        elif game_state.controlled_can_just_walk:
             if time > settings.TIME_TO_RETREAT:
                 self.controlled_character.relinquish_control()
+                game_state.controlled_can_just_walk = False
+                game_state.waiting_for_things_to_settle = True
                 self.refresh_tick()
-                self.game_state.controlled_can_just_walk = False
-                self.game_state.waiting_for_things_to_settle = True
 
-        elif self.game_state.waiting_for_things_to_settle:
+        elif game_state.waiting_for_things_to_settle:
             if self.settled:
-                self.game_state.waiting_for_things_to_settle = False
-                self.game_state.between_turns = True
+                game_state.waiting_for_things_to_settle = False
+                game_state.between_turns = True
                 self.refresh_tick()
 
         # Switches to a new time if enough time has passed.
-        elif self.game_state.between_turns and time > settings.TIME_TO_WAIT_FOR_TURN:
+        elif game_state.between_turns and time > settings.TIME_TO_WAIT_FOR_TURN:
             if self._number_of_alive_teams() > 1:
                 next_team = self.next_team(self.last_controlled.details.team)
-                self.last_controlled = next(next_team.character_queue)
+                self.last_controlled = next_team.next_character()
                 self.last_controlled.take_control()
-                self.game_state.between_turns = False
-                self.game_state.controlled_can_attack = True
+                game_state.between_turns = False
+                game_state.controlled_can_attack = True
                 self.refresh_tick()
                 return self.last_controlled.kinematics.intpos
 
             else:
-                self.game_state.between_turns = False
-                self.game_state.end_game = True
+                game_state.between_turns = False
+                game_state.end_game = True
                 self._announce_victor()
 
         return None
@@ -232,20 +334,43 @@ class PlayingField:
             Boolean for whether or not anything is happening, such as a character or projectile
             moving.
         """
-        return all(wo.is_in_steady_state() for wo in self.world_objects)
+        return not self._unsettled_objects
 
     def _number_of_alive_teams(self) -> int:
         """Returns the number of all the teams still alive.
 
+        The count is reused until a character is added, removed, or killed.
+
         Returns:
             The number of all teams filtering out dead teams.
         """
-        return len({team for team in self.teams if team.check_if_alive()})
+        if self._alive_team_count is None:
+            self._alive_team_count = len({team for team in self.teams if team.check_if_alive()})
+
+        return self._alive_team_count
 
     def refresh_tick(self) -> None:
-        """Acknowledges when the last change in state occurred."""
+        """Acknowledges when the last change in state occurred.
+
+        This must be called after the game state has been changed, so that the next tick at which
+        the game state could change again is found from the new state.
+        """
         self.game_state.last_general_tick = ticks.total_ticks
 
+        # Finds how long the new game state lasts, if it is limited by time.
+        if self.game_state.controlled_can_attack:
+            time_limit = settings.TIME_TO_ACT
+        elif self.game_state.controlled_can_just_walk:
+            time_limit = settings.TIME_TO_RETREAT
+        elif self.game_state.waiting_for_things_to_settle:
+            self._next_state_check_tick = ticks.total_ticks
+            return
+        else:
+            time_limit = settings.TIME_TO_WAIT_FOR_TURN
+
+        # The time limit is only exceeded on the tick after it is reached.
+        self._next_state_check_tick = ticks.total_ticks + time_limit * settings.TICKS_PER_SECOND + 1
+
     def process_mask(
         self,
         overlay: Callable[
@@ -259,34 +384,95 @@ class PlayingField:
             overlay: A function which takes the x index, the y index, and the existing mask values
                 to create a new mask.
         """
-        # Obtains the size of the image.
-        width = self.image.get_width()
-        height = self.image.get_height()
-
-        # Creates two index matrices.
-        x = np.column_stack([np.arange(width)] * height)
-        y = np.row_stack([np.arange(height)] * width)
+        # Creates two open index grids, which broadcast to the size of the playing field without
+        # allocating a full matrix of indices for each axis.
+        y, x = np.ogrid[0 : self.height, 0 : self.width]
 
         # Applies the mask.
-        self.mask = self.mask & overlay(x, y, self.mask)
+        self.mask &= overlay(x, y, self.mask)
+        self.terrain_version += 1
+
+        self._update_alpha([(0, 0, self.width, self.height)])
+
+    def _update_alpha(self, regions: Iterable[tuple[int, int, int, int]]) -> None:
+        """Overwrites the alpha channel of the image with the mask, only within some regions.
 
-        # Obtains the mutable array for the present alpha of the image
-        # and overwrites the old alpha channel.
-        surface_alpha = np.array(self.image.get_view("A"), copy=False)
-        surface_alpha[:, :] = self.mask * 255
+        Args:
+            regions: The left, top, right, and bottom edges of each region, with the right and
+                bottom edges exclusive.
+        """
+        # Obtains an array referencing the present alpha of the image, with rows first like the
+        # mask. The image stays locked while the array exists, so it is released straight away to
+        # allow the image to be drawn.
+        surface_alpha = pygame.surfarray.pixels_alpha(self.image).T
+
+        # Scales the mask straight into the image, without a temporary array for the product.
+        for x0, y0, x1, y1 in regions:
+            np.multiply(self.mask[y0:y1, x0:x1], 255, out=surface_alpha[y0:y1, x0:x1])
+
+        del surface_alpha
+
+    def _flush_craters(self) -> None:
+        """Shows every crater carved since the last flush on the image of the playing field."""
+        if self._dirty_regions:
+            self._update_alpha(self._dirty_regions)
+            self._dirty_regions.clear()
+
+    def _carve_crater(self, pos: npt.NDArray[np.double], radius: int) -> None:
+        """Removes the solid ground within a circle, only touching the circle's bounding box.
+
+        Args:
+            pos: The centre of the circle, which is rounded to the nearest pixel.
+            radius: The radius of the circle.
+        """
+        centre_x, centre_y = round(float(pos[0])), round(float(pos[1]))
+
+        # Finds the bounding box of the circle, clipped to the playing field.
+        x0 = max(0, centre_x - radius)
+        x1 = min(self.width, centre_x + radius + 1)
+        y0 = max(0, centre_y - radius)
+        y1 = min(self.height, centre_y + radius + 1)
+
+        if x0 >= x1 or y0 >= y1:
+            return
 
-    def get_world_objects(self, world_object_type: type[WO]) -> Generator[WO, None, None]:
-        """Finds all world objects of the corresponding type.
+        # Keeps only the ground outside the circle, using the part of the template within the box.
+        stamp = _crater_stamp(radius)
+        self.mask[y0:y1, x0:x1] &= stamp[
+            y0 - centre_y + radius : y1 - centre_y + radius,
+            x0 - centre_x + radius : x1 - centre_x + radius,
+        ]
+        self.terrain_version += 1
+
+        # Leaves the alpha channel of the image within the box to be overwritten once all world
+        # objects have updated, as it is only needed when the playing field is drawn.
+        self._dirty_regions.append((x0, y0, x1, y1))
+
+    def add_world_object(self, world_object: world_objects.WorldObject) -> None:
+        """Places a world object onto the playing field.
 
         Args:
-            world_object_type: The type of world object to be yielded.
+            world_object: The world object to be added.
+        """
+        self.world_objects.append(world_object)
 
-        Yields:
-            Every world object instance in the playing field of the corresponding type.
+        if isinstance(world_object, characters.Character):
+            self._characters.append(world_object)
+            self.invalidate_alive_characters()
+            self.invalidate_character_arrays()
+
+    def remove_world_object(self, world_object: world_objects.WorldObject) -> None:
+        """Takes a world object off the playing field.
+
+        Args:
+            world_object: The world object to be removed.
         """
-        for world_object in self.world_objects:
-            if isinstance(world_object, world_object_type):
-                yield world_object
+        self.world_objects.remove(world_object)
+
+        if isinstance(world_object, characters.Character):
+            self._characters.remove(world_object)
+            self.invalidate_alive_characters()
+            self.invalidate_character_arrays()
 
     @property
     def controlled_character_or_none(self) -> characters.Character | None:
@@ -298,12 +484,15 @@ class PlayingField:
         Raises:
             AttributeError: No character is being controlled.
         """
-        # Iterates over all objects in the world which are the user.
-        for character in self.characters:
-            if character.control.controlled:
-                return character
+        return self._controlled
 
-        return None
+    def set_controlled_character(self, character: characters.Character | None) -> None:
+        """Records which character is being controlled by the user.
+
+        Args:
+            character: The character now being controlled, or None if no character is.
+        """
+        self._controlled = character
 
     @property
     def controlled_character(self) -> characters.Character:
@@ -346,6 +535,18 @@ class PlayingField:
         if character is not None and character.details.team.ai is None:
             character.process_key_presses(pressed_keys)
 
+    def is_out_of_bounds(self, x: float, y: float) -> bool:
+        """Determines if a location has left the playing field, through its sides or its bottom.
+
+        Args:
+            x: The x-location.
+            y: The y-location.
+
+        Returns:
+            Whether or not the location is outside the playing field.
+        """
+        return x < 0 or x > self.width or y > self.height
+
     def collision_pixel(self, x: float, y: float) -> bool:
         """Determines if a pixel location on the playing field is solid or not.
 
@@ -356,11 +557,8 @@ class PlayingField:
         Returns:
             Whether or not the pixel location is a solid.
         """
-        return (
-            0 <= x < self.mask.shape[0]
-            and 0 <= y < self.mask.shape[1]
-            and bool(self.mask[int(x), int(y)])
-        )
+        # Reads the mask value as a Python integer rather than boxing it as a NumPy scalar.
+        return 0 <= x < self.width and 0 <= y < self.height and self.mask.item(int(y), int(x)) != 0
 
     def explosion(
         self,
@@ -376,21 +574,40 @@ class PlayingField:
             radius: The radius of the blast.
         """
         # Damages the terrain in a circular shape.
-        self.process_mask(lambda x, y, _mask: (x - pos[0]) ** 2 + (y - pos[1]) ** 2 > radius**2)
+        self._carve_crater(pos, radius)
 
         # Affects nearby characters caught in the blast.
-        for character in self.alive_characters():
-            explosion.check_character_caught_by_explosion(pos, character, caused_by, radius)
+        characters = self.alive_character_arrays
+        caught, distances, blast_directions = explosion.find_characters_caught_by_explosion(
+            pos, characters.positions, radius
+        )
+        for index, distance, blast_direction in zip(
+            caught, distances, blast_directions, strict=True
+        ):
+            explosion.character_caught_by_explosion(
+                characters.characters[index], caused_by, blast_direction, float(distance), radius
+            )
 
-    def time_left_on_clock(self) -> float:
-        """Determines how much time is left on the clock to perform an action.
+        # The characters caught have been damaged and flung.
+        self.invalidate_character_arrays()
+
+    @property
+    def time_since_state_change(self) -> float:
+        """Determines how much time has passed since the game state last changed.
 
         Returns:
-            The number of seconds until the game state changes.
+            The number of seconds since the last change in state.
         """
         ticks_passed = ticks.total_ticks - self.game_state.last_general_tick
-        time_passed = ticks_passed / settings.TICKS_PER_SECOND
-        return np.ceil(settings.TIME_TO_ACT - time_passed)
+        return ticks_passed / settings.TICKS_PER_SECOND
+
+    def time_left_on_clock(self) -> int:
+        """Determines how much time is left on the clock to perform an action.
+
+        Returns:
+            The number of whole seconds, rounded up, until the game state changes.
+        """
+        return math.ceil(settings.TIME_TO_ACT - self.time_since_state_change)
 
     def draw(self, display: bombsite.display.Display) -> None:
         """Draws the playing field onto the display.
@@ -402,17 +619,19 @@ class PlayingField:
             world_object.draw(display)
 
     @property
-    def characters(self) -> Generator[characters.Character, None, None]:
-        """Yields each world object that is a character.
+    def characters(self) -> list[characters.Character]:
+        """Returns each world object that is a character.
 
-        Yields:
-            Each character in the world.
+        Returns:
+            Each character in the world, in the order they were added.
         """
-        yield from self.get_world_objects(characters.Character)
+        return self._characters
 
     def find_collision_point(
-        self, lower_bound: npt.NDArray[np.int64], upper_bound: npt.NDArray[np.int64]
-    ) -> npt.NDArray[np.int64]:
+        self,
+        lower_bound: tuple[int, int] | npt.NDArray[np.int64],
+        upper_bound: tuple[int, int] | npt.NDArray[np.int64],
+    ) -> tuple[int, int]:
         """Finds the location at which a collision happens on the playing field.
 
         Args:
@@ -428,15 +647,20 @@ class PlayingField:
             solution was not found. This should be impossible, even for the largest of playing
             fields.
         """
+        lower_x, lower_y = int(lower_bound[0]), int(lower_bound[1])
+        upper_x, upper_y = int(upper_bound[0]), int(upper_bound[1])
+
         for _i in range(100):
-            centre = np.ceil((lower_bound + upper_bound) / 2).astype(int)
+            # Rounds the midpoint upwards, using integer arithmetic only.
+            centre_x = -((-lower_x - upper_x) // 2)
+            centre_y = -((-lower_y - upper_y) // 2)
 
-            if np.array_equal(centre, upper_bound) or np.array_equal(centre, lower_bound):
-                return lower_bound
+            if (centre_x, centre_y) in ((upper_x, upper_y), (lower_x, lower_y)):
+                return lower_x, lower_y
 
-            if self.collision_pixel(*centre):
-                upper_bound = centre
+            if self.collision_pixel(centre_x, centre_y):
+                upper_x, upper_y = centre_x, centre_y
             else:
-                lower_bound = centre
+                lower_x, lower_y = centre_x, centre_y
 
         raise ValueError("Cannot resolve position.")
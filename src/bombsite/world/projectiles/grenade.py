@@ -7,10 +7,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import numpy as np
 import pygame
 
-from bombsite.settings import GRENADE_BLAST_RADIUS
+from bombsite.settings import GRAVITY, GRENADE_BLAST_RADIUS
 from bombsite.world.misc.explosion import estimate_explosion_damage
 
 from . import projectiles
@@ -28,6 +27,8 @@ class Grenade(projectiles.Projectile):
         frames_left: The number of frames left before the grenade detonates.
     """
 
+    __slots__ = ("frames_left",)
+
     def __init__(
         self,
         pf: PlayingField,
@@ -66,20 +67,14 @@ class Grenade(projectiles.Projectile):
             self.pf.explosion(self.kinematics.pos, self.sent_by, self.explosion_radius())
             self.destroy()
 
-        self.apply_gravity()
-        self._update_position()
+        self._fall()
 
         # Runs the fuse on how long the grenade has left to explode.
         self.frames_left -= 1
 
     def _collide(self) -> None:
         """Enacts a collision with the playing field."""
-        lower_bound = self.kinematics.pos.astype(int)
-
-        if not self.pf.collision_pixel(*lower_bound):
-            upper_bound = (self.kinematics.pos + self.kinematics.vel).astype(int)
-            self.set_pos(self.pf.find_collision_point(lower_bound, upper_bound))
-
+        self._move_to_collision_point()
         self._bounce()
 
     def phantom(self, target: Character) -> tuple[int, float]:
@@ -91,25 +86,46 @@ class Grenade(projectiles.Projectile):
         Returns: A tuple containing the expected damage from the attack, and the distance from the
             targeted character.
         """
-        while True:
-            # Checks if the grenade should explode.
-            if self.frames_left <= 0:
-                distance = float(np.linalg.norm(self.kinematics.pos - target.kinematics.pos))
-                return estimate_explosion_damage(self), distance
-
-            # Destroys the grenade if it leaves the map.
-            if self._exited_playing_field():
-                return 0, float(np.linalg.norm(self.kinematics.pos - target.kinematics.pos))
-
+        # Looks up the attributes used on every step of the flight only once.
+        kinematics = self.kinematics
+        width, height = self.pf.width, self.pf.height
+        mask_value = self.pf.mask.item
+
+        # Steps the flight on Python floats rather than on the arrays of the grenade's kinematics,
+        # which are only brought up to date when the grenade bounces. The checks of
+        # PlayingField.is_out_of_bounds and PlayingField.collision_pixel are written out in place
+        # to avoid two method calls on every step.
+        x, y = kinematics.x, kinematics.y
+        vx, vy = kinematics.vx, kinematics.vy
+        frames_left = self.frames_left
+
+        # Runs until the grenade either explodes or leaves the map.
+        while frames_left > 0 and not (x < 0 or x > width or y > height):
             # Causes the grenade to fall.
-            self.apply_gravity()
-            if self._will_collide():
+            vy += GRAVITY
+            next_x, next_y = int(x + vx), int(y + vy)
+            if 0 <= next_x < width and 0 <= next_y < height and mask_value(next_y, next_x) != 0:
+                self.set_pos((x, y))
+                kinematics.vx, kinematics.vy = vx, vy
                 self._collide()
+                x, y = kinematics.x, kinematics.y
+                vx, vy = kinematics.vx, kinematics.vy
             else:
-                self.set_pos(self.kinematics.pos + self.kinematics.vel)
+                x += vx
+                y += vy
 
             # Runs the fuse on how long the grenade has left to explode.
-            self.frames_left -= 1
+            frames_left -= 1
+
+        self.set_pos((x, y))
+        kinematics.vx, kinematics.vy = vx, vy
+        self.frames_left = frames_left
+
+        # Destroys the grenade if it leaves the map before exploding.
+        if frames_left > 0:
+            return 0, self.distance_to(target)
+
+        return estimate_explosion_damage(self), self.distance_to(target)
 
     @property
     def _bounce_halting_speed(self) -> float:
@@ -22,6 +22,8 @@ class Projectile(WorldObject):
         sent_by: The character that launched the projectile.
     """
 
+    __slots__ = ("sent_by",)
+
     def __init__(
         self,
         pf: playing_field.PlayingField,
@@ -54,7 +56,7 @@ class Projectile(WorldObject):
 
     def destroy(self) -> None:
         """Removes the projectile."""
-        self.pf.world_objects.remove(self)
+        self.pf.remove_world_object(self)
 
     @abc.abstractmethod
     def phantom(self, target: Character) -> tuple[int, float]:
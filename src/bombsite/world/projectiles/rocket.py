@@ -7,10 +7,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import numpy as np
 import pygame
 
-from bombsite.settings import ROCKET_BLAST_RADIUS
+from bombsite.settings import GRAVITY, ROCKET_BLAST_RADIUS
 from bombsite.world.misc.explosion import estimate_explosion_damage
 
 from . import projectiles
@@ -23,6 +22,8 @@ if TYPE_CHECKING:
 class Rocket(projectiles.Projectile):
     """The rocket which explodes immediately on contact, damaging the surrounding area."""
 
+    __slots__ = ()
+
     def explosion_radius(self) -> int:
         """The blast radius of the explosion caused by a rocket.
 
@@ -39,11 +40,10 @@ class Rocket(projectiles.Projectile):
             return
 
         # Causes the projectile to fall.
-        self.apply_gravity()
-        self._update_position(check_collision=False)
+        self._fall(check_collision=False)
 
         # Detonates the projectile if it collides with the terrain.
-        if self.pf.collision_pixel(*self.kinematics.pos):
+        if self.pf.collision_pixel(self.kinematics.x, self.kinematics.y):
             self.pf.explosion(self.kinematics.pos, self.sent_by, self.explosion_radius())
             self.destroy()
 
@@ -56,17 +56,34 @@ class Rocket(projectiles.Projectile):
         Returns: A tuple containing the expected damage from the attack, and the distance from the
             targeted character.
         """
+        # Looks up the attributes used on every step of the flight only once.
+        kinematics = self.kinematics
+        width, height = self.pf.width, self.pf.height
+        mask_value = self.pf.mask.item
+
+        # Steps the flight on Python floats rather than on the arrays of the rocket's kinematics,
+        # with the checks of PlayingField.is_out_of_bounds and PlayingField.collision_pixel written
+        # out in place to avoid two method calls on every step.
+        x, y = kinematics.x, kinematics.y
+        vx, vy = kinematics.vx, kinematics.vy
+
         while True:
-            self.apply_gravity()
-            self.set_pos(self.kinematics.pos + self.kinematics.vel)
+            vy += GRAVITY
+            x += vx
+            y += vy
 
-            # Destroys the projectile if it leaves the map.
-            if self._exited_playing_field():
-                return 0, float(np.linalg.norm(self.kinematics.pos - target.kinematics.pos))
+            exited = x < 0 or x > width or y > height
+            if exited or (0 <= y < height and x < width and mask_value(int(y), int(x)) != 0):
+                break
+
+        self.set_pos((x, y))
+        kinematics.vy = vy
+
+        # Destroys the projectile if it leaves the map.
+        if exited:
+            return 0, self.distance_to(target)
 
-            if self.pf.collision_pixel(*self.kinematics.pos):
-                distance = float(np.linalg.norm(self.kinematics.pos - target.kinematics.pos))
-                return estimate_explosion_damage(self), distance
+        return estimate_explosion_damage(self), self.distance_to(target)
 
     def is_in_steady_state(self) -> bool:
         """Determines whether or not the world object is going to remain still without provocation.
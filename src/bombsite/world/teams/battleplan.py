@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from bombsite.world.attacks.attack import Attack
 
 
-@dataclass
+@dataclass(slots=True)
 class BattlePlan:
     """Contains a collection of attributes that an AI uses in launching an attack."""
 
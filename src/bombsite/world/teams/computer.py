@@ -5,12 +5,11 @@ Copyright © 2024 - Elliot Simpson
 
 from __future__ import annotations
 
+import time
 from collections.abc import Generator
-from itertools import product
 from typing import TYPE_CHECKING
 
 import numpy as np
-import pygame
 
 from bombsite import settings
 from bombsite.ui.attackselector import AttackSelector
@@ -22,6 +21,10 @@ if TYPE_CHECKING:
     from bombsite.world.characters.characters import Character
     from bombsite.world.teams.teams import Team
 
+# The firing angles and strengths which the AI considers for each attack.
+_FIRING_ANGLES = np.linspace(settings.MINIMUM_FIRING_ANGLE, settings.MAXIMUM_FIRING_ANGLE, 10)
+_FIRING_STRENGTHS = np.linspace(0, settings.MAXIMUM_FIRING_POWER)
+
 
 class Computer:
     """A computer AI which can issue commands to the characters.
@@ -32,8 +35,19 @@ class Computer:
             best course of action.
         battleplan: The best course of action yet found via battleplan_generator.
         _targeting_character: The character that the AI has most recently decided to attack.
+        _search_key: What the battleplans being searched depend on, as found when the search began.
+        _last_battleplan: The key and the result of the most recently completed search, if any.
     """
 
+    __slots__ = (
+        "team",
+        "battleplan_generator",
+        "battleplan",
+        "_targeting_character",
+        "_search_key",
+        "_last_battleplan",
+    )
+
     def __init__(self, team: Team) -> None:
         """Creates the computer according to the provided parameters.
 
@@ -44,6 +58,8 @@ class Computer:
         self.battleplan_generator: Generator[BattlePlan, None, None] | None = None
         self.battleplan: BattlePlan | None = None
         self._targeting_character: Character | None = None
+        self._search_key: tuple[object, ...] | None = None
+        self._last_battleplan: tuple[tuple[object, ...], BattlePlan] | None = None
 
     @property
     def targeting_character_or_none(self) -> Character | None:
@@ -87,18 +103,16 @@ class Computer:
         Args:
             controlled: The character which the team's AI is presently controlling.
         """
+        characters = self.team.pf.alive_character_arrays
         nearest_enemy = None
-        nearest_enemy_dist = 0.0
-
-        for character in self.team.pf.characters:
-            if character.details.team is self.team or not character.health.alive:
-                continue
 
-            new_enemy_dist = np.linalg.norm(character.kinematics.pos - controlled.kinematics.pos)
-
-            if not nearest_enemy or nearest_enemy_dist > new_enemy_dist:
-                nearest_enemy = character
-                nearest_enemy_dist = float(new_enemy_dist)
+        # Compares the squared distances to every living character on other teams, as only their
+        # ordering matters.
+        enemies = np.flatnonzero(characters.team_numbers != self.team.team_number)
+        if enemies.size:
+            vectors = characters.positions[enemies] - controlled.kinematics.pos
+            squared_distances = np.einsum("ij,ij->i", vectors, vectors)
+            nearest_enemy = characters.characters[enemies[np.argmin(squared_distances)]]
 
         # Faces the controlled character towards the target.
         if nearest_enemy is not None:
@@ -120,14 +134,15 @@ class Computer:
 
         attack = attack_type()
 
-        for facing_l, angle, strength in product(
-            (True, False),
-            np.linspace(settings.MINIMUM_FIRING_ANGLE, settings.MAXIMUM_FIRING_ANGLE, 10),
-            np.linspace(0, settings.MAXIMUM_FIRING_POWER),
-        ):
-            attack_override = AttackOverride(facing_l, angle, strength)
-            damage, distance = attack.release_phantom(controlled, attack_override)
-            yield BattlePlan(facing_l, angle, strength, damage, distance, attack)
+        for facing_l in (True, False):
+            # Finds the firing direction for every angle at once.
+            directions = controlled.angle_array_batch(_FIRING_ANGLES, facing_l)
+
+            for angle, direction in zip(_FIRING_ANGLES, directions, strict=True):
+                for strength in _FIRING_STRENGTHS:
+                    attack_override = AttackOverride(facing_l, angle, strength, direction)
+                    damage, distance = attack.release_phantom(controlled, attack_override)
+                    yield BattlePlan(facing_l, angle, strength, damage, distance, attack)
 
     def run_ai(self, controlled: Character) -> None:
         """Operates the AI for the team.
@@ -167,10 +182,10 @@ class Computer:
 
     def _find_multiple_new_battleplans(self) -> None:
         """Continuously checks battleplans until a suitable plan is found or time runs out."""
-        start_time = pygame.time.get_ticks()
-        milliseconds_per_tick = 1_000 / settings.TICKS_PER_SECOND
+        # Spends up to half of each tick searching, reading the clock after every battleplan.
+        deadline = time.perf_counter_ns() + 1_000_000_000 // (2 * settings.TICKS_PER_SECOND)
 
-        while pygame.time.get_ticks() - start_time < milliseconds_per_tick / 2:
+        while time.perf_counter_ns() < deadline:
             self._find_new_battleplan()
             if self.battleplan_generator is None:
                 break
@@ -180,8 +195,15 @@ class Computer:
         # If a battleplan has not been found, and no battleplans have been searched, begins to look,
         # considering the first battleplan found the best so far.
         if self.battleplan is None and self.battleplan_generator is None:
+            # Reuses the result of the last search if nothing it depends on has changed since.
+            self._search_key = self._battleplan_key()
+            if self._last_battleplan is not None and self._last_battleplan[0] == self._search_key:
+                self.battleplan = self._last_battleplan[1]
+                return
+
             self.battleplan_generator = self.iterate_over_attack_plans()
             self.battleplan = next(self.battleplan_generator)
+            self._stop_if_target_defeated()
             return
 
         # Raises an error if no battle plan is found, despite having looked.
@@ -199,7 +221,7 @@ class Computer:
 
         # If battleplans have been found, stops searching.
         except StopIteration:
-            self.battleplan_generator = None
+            self._finish_search(self.battleplan)
             return
 
         # Replaces the current battleplan if it is inferior to the newly found battleplan.
@@ -208,6 +230,55 @@ class Computer:
             and new_battleplan.expected_distance < self.battleplan.expected_distance
         ):
             self.battleplan = new_battleplan
+            self._stop_if_target_defeated()
+
+    def _stop_if_target_defeated(self) -> None:
+        """Ends the search early once the best battleplan so far could kill the targeted character.
+
+        This knowingly changes which battleplan is chosen. The first battleplan whose expected
+        damage reaches the target's remaining health is kept, even if a later one would cause more
+        damage by catching other enemies in the blast, or equal damage while landing nearer the
+        target.
+        """
+        target = self.targeting_character_or_none
+        if (
+            self.battleplan is not None
+            and self.battleplan_generator is not None
+            and target is not None
+            and target.health.alive
+            and self.battleplan.expected_damage >= target.health.hp
+        ):
+            self.battleplan_generator.close()
+            self._finish_search(self.battleplan)
+
+    def _finish_search(self, battleplan: BattlePlan) -> None:
+        """Ends the search for battleplans, remembering its result.
+
+        Args:
+            battleplan: The best battleplan that the search found.
+        """
+        self.battleplan_generator = None
+        if self._search_key is not None:
+            self._last_battleplan = (self._search_key, battleplan)
+
+    def _battleplan_key(self) -> tuple[object, ...]:
+        """Describes everything that the outcome of a search for battleplans depends on.
+
+        Returns:
+            A tuple which compares equal to another only if both searches would find the same
+            battleplan.
+        """
+        pf = self.team.pf
+        characters = pf.alive_character_arrays
+
+        return (
+            pf.controlled_character,
+            self.targeting_character_or_none,
+            pf.terrain_version,
+            tuple(characters.characters),
+            characters.positions.tobytes(),
+            characters.hp.tobytes(),
+        )
 
     def iterate_over_attack_plans(self) -> Generator[BattlePlan, None, None]:
         """Iterates over each attack and yields all possible associated battleplans.
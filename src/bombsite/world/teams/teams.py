@@ -5,8 +5,6 @@ Copyright © 2024 - Elliot Simpson
 
 from __future__ import annotations
 
-from collections.abc import Generator
-
 import pygame
 
 from bombsite.world import playing_field
@@ -28,8 +26,9 @@ class Team:
         pf: The playing field in which the team fights.
         team_number: An integer unique to the team amongst all teams on the playing field.
         characters: A list of all characters in the team.
-        character_queue: A generator which continually provides the next character to be controlled
-            from the team.
+        alive_count: The number of characters in the team that are still alive.
+        _next_index: The index in the list of characters from which to look for the next character
+            to be controlled from the team.
         ai: The AI acting on the team, if there is one, otherwise None.
         attack: The present attack the character is using.
     """
@@ -44,8 +43,9 @@ class Team:
         self.pf: playing_field.PlayingField = pf
         self.team_number: int = len(pf.teams) + 1
         self.characters: list[characters.Character] = []
+        self.alive_count: int = 0
         pf.teams.append(self)
-        self.character_queue: Generator[characters.Character, None, None] = self.next_character()
+        self._next_index: int = 0
         self.ai: Computer | None = self.get_ai(has_ai)
         self.attack: Attack = RocketLauncher()
 
@@ -83,18 +83,27 @@ class Team:
         Returns:
             Returns a boolean for whether there is at least one living character.
         """
-        return any(character.health.alive for character in self.characters)
+        return self.alive_count > 0
 
-    def next_character(self) -> Generator[characters.Character, None, None]:
-        """Continuously cycles over the living characters.
+    def next_character(self) -> characters.Character:
+        """Cycles to the next living character.
 
-        Yields:
+        Returns:
             The next character available to play.
+
+        Raises:
+            ValueError: No character in the team is alive.
         """
-        while True:
-            for character in self.characters.copy():
-                if character.health.alive:
-                    yield character
+        number_of_characters = len(self.characters)
+
+        for offset in range(number_of_characters):
+            index = (self._next_index + offset) % number_of_characters
+            character = self.characters[index]
+            if character.health.alive:
+                self._next_index = index + 1
+                return character
+
+        raise ValueError(f"{self} has no living characters.")
 
     def add_character(self, x: int, y: int, name: str) -> characters.Character:
         """Adds a character to the team adhering to certain parameters.
@@ -112,6 +121,7 @@ class Team:
 
         # Adds the character to the world.
         self.characters.append(new_character)
+        self.alive_count += 1
 
         return new_character
 
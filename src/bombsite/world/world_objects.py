@@ -6,12 +6,15 @@ Copyright © 2024 - Elliot Simpson
 from __future__ import annotations
 
 import abc
+import math
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import numpy as np
 import numpy.typing as npt
 
+from bombsite.settings import GRAVITY
+
 if TYPE_CHECKING:
     import bombsite.display
     from bombsite.world import playing_field
@@ -34,7 +37,7 @@ class Kinematics:
         Returns:
             The world object's floating-point-value x-position.
         """
-        return float(self.pos[0])
+        return self.pos.item(0)
 
     @x.setter
     def x(self, value: float) -> None:
@@ -52,7 +55,7 @@ class Kinematics:
         Returns:
             The world object's floating-point-value y-position.
         """
-        return float(self.pos[1])
+        return self.pos.item(1)
 
     @y.setter
     def y(self, value: float) -> None:
@@ -70,7 +73,7 @@ class Kinematics:
         Returns:
             The world object's floating-point-value x-velocity.
         """
-        return float(self.vel[0])
+        return self.vel.item(0)
 
     @vx.setter
     def vx(self, value: float) -> None:
@@ -88,7 +91,7 @@ class Kinematics:
         Returns:
             The world object's floating-point-value y-velocity.
         """
-        return float(self.vel[1])
+        return self.vel.item(1)
 
     @vy.setter
     def vy(self, value: float) -> None:
@@ -99,6 +102,25 @@ class Kinematics:
         """
         self.vel[1] = value
 
+    @property
+    def speed(self) -> float:
+        """The getter for the magnitude of the object's velocity.
+
+        Returns:
+            The world object's floating-point-value speed.
+        """
+        return math.hypot(self.vel.item(0), self.vel.item(1))
+
+    @property
+    def is_moving(self) -> bool:
+        """The getter for whether or not the object has any velocity.
+
+        Returns:
+            True if either component of the object's velocity is non-zero, otherwise False.
+        """
+        # Reads the components as Python floats rather than reducing over the array.
+        return self.vel.item(0) != 0.0 or self.vel.item(1) != 0.0
+
     @property
     def intpos(self) -> tuple[int, int]:
         """The getter for the integer-position of the object.
@@ -110,8 +132,7 @@ class Kinematics:
 
     def null_velocity(self) -> None:
         """Sets the world object's velocity components to zero."""
-        self.vx = 0.0
-        self.vy = 0.0
+        self.vel.fill(0.0)
 
 
 class WorldObject(abc.ABC):
@@ -122,6 +143,8 @@ class WorldObject(abc.ABC):
         kinematics: The motion-related attributes of the object.
     """
 
+    __slots__ = ("pf", "kinematics")
+
     def __init__(
         self,
         pf: playing_field.PlayingField,
@@ -140,6 +163,19 @@ class WorldObject(abc.ABC):
             pos=np.array(position, dtype=np.double), vel=np.array(velocity, dtype=np.double)
         )
 
+    def distance_to(self, other: WorldObject) -> float:
+        """Finds the distance between the world object and another.
+
+        Args:
+            other: The other world object.
+
+        Returns:
+            The distance in pixels between the two world objects.
+        """
+        return math.hypot(
+            self.kinematics.x - other.kinematics.x, self.kinematics.y - other.kinematics.y
+        )
+
     def debug_show_position(self, r: int = 3) -> None:
         """Displays the map area surrounding the character.
 
@@ -148,8 +184,8 @@ class WorldObject(abc.ABC):
         """
         x_slice = slice(int(self.kinematics.x) - r + 1, int(self.kinematics.x) + r)
         y_slice = slice(int(self.kinematics.y) - r + 1, int(self.kinematics.y) + r)
-        section = self.pf.mask[x_slice, y_slice]
-        for row in section.transpose():
+        section = self.pf.mask[y_slice, x_slice]
+        for row in section:
             print("".join("X" if mask_value else "." for mask_value in row))
 
     @abc.abstractmethod
@@ -164,10 +200,6 @@ class WorldObject(abc.ABC):
             True if the renderer should display the object on the screen, otherwise False.
         """
 
-    def apply_gravity(self) -> None:
-        """Accelerates the object downwards."""
-        self.kinematics.vy += 0.05
-
     @abc.abstractmethod
     def draw(self, display: bombsite.display.Display) -> None:
         """Draws the world object onto the playing field.
@@ -192,13 +224,13 @@ class WorldObject(abc.ABC):
         """
         self.kinematics.vy = vy
 
-    def set_pos(self, pos: npt.NDArray[np.double | np.int64]) -> None:
+    def set_pos(self, pos: tuple[float, float] | npt.NDArray[np.double | np.int64]) -> None:
         """Sets new values for the x and y components of the world object.
 
         Args:
             pos: The position of the world object.
         """
-        self.kinematics.pos = pos.astype(float)
+        self.kinematics.pos = np.array(pos, dtype=np.double)
 
     def _surrounding_is(self, match: npt.NDArray[np.int_]) -> bool:
         """Checks if the mask around the character matches the template given.
@@ -221,9 +253,9 @@ class WorldObject(abc.ABC):
 
         # Obtains the part of the mask around the character, using clipping to prevent index errors
         # when the character is outside the map boundaries.
-        x, y = self.kinematics.pos.astype(int)
-        cols = self.pf.mask.take(range(x - 1, x + 2), axis=0, mode="clip")
-        section = cols.take(range(y - 1, y + 2), axis=1, mode="clip").transpose()
+        x, y = self.kinematics.intpos
+        rows = self.pf.mask.take(range(y - 1, y + 2), axis=0, mode="clip")
+        section = rows.take(range(x - 1, x + 2), axis=1, mode="clip")
 
         # An error only occurs where the sum of the mask and match at a position is equal to 1,
         # which only happens when one value is 0 and another value is 1, meaning that whatever
@@ -261,7 +293,7 @@ class WorldObject(abc.ABC):
     def _bounce(self) -> None:
         """Bounces off whatever surface the character hit."""
         # Does not bounce if not fast enough.
-        if np.linalg.norm(self.kinematics.vel) <= self._bounce_halting_speed:
+        if self.kinematics.speed <= self._bounce_halting_speed:
             self.kinematics.null_velocity()
 
         # Bounces if the ground is flat.
@@ -286,22 +318,40 @@ class WorldObject(abc.ABC):
         Returns:
             True if a collision has occurred, otherwise false.
         """
-        return self.pf.collision_pixel(*(self.kinematics.pos + self.kinematics.vel).astype(int))
+        # Works on Python scalars, as this runs for every moving object on every tick.
+        kinematics = self.kinematics
+        return self.pf.collision_pixel(
+            int(kinematics.x + kinematics.vx), int(kinematics.y + kinematics.vy)
+        )
 
     def _collide(self) -> None:
         """Enacts a collision with the playing field."""
         raise NotImplementedError
 
-    def _update_position(self, check_collision: bool = True) -> None:
-        """Updates the position of the world object, checking for collision if necessary.
+    def _move_to_collision_point(self) -> None:
+        """Moves the world object up to where its movement on this tick meets the playing field."""
+        kinematics = self.kinematics
+        lower_bound = kinematics.intpos
+
+        if not self.pf.collision_pixel(*lower_bound):
+            upper_bound = (int(kinematics.x + kinematics.vx), int(kinematics.y + kinematics.vy))
+            self.set_pos(self.pf.find_collision_point(lower_bound, upper_bound))
+
+    def _fall(self, check_collision: bool = True) -> None:
+        """Accelerates the world object downwards and updates its position in a single step.
 
         Args:
             check_collision: Whether or not to check for collision.
         """
+        # Works on Python scalars, as this runs for every moving object on every tick.
+        kinematics = self.kinematics
+        kinematics.vy += GRAVITY
+
         if check_collision and self._will_collide():
             self._collide()
         else:
-            self.set_pos(self.kinematics.pos + self.kinematics.vel)
+            kinematics.x += kinematics.vx
+            kinematics.y += kinematics.vy
 
     @abc.abstractmethod
     def is_in_steady_state(self) -> bool:
@@ -318,8 +368,4 @@ class WorldObject(abc.ABC):
         Returns:
             True if the world object is still in the playing field, False otherwise.
         """
-        return (
-            self.kinematics.x < 0
-            or self.kinematics.x > self.pf.mask.shape[0]
-            or self.kinematics.y > self.pf.mask.shape[1]
-        )
+        return self.pf.is_out_of_bounds(self.kinematics.x, self.kinematics.y)